@@ -6,9 +6,13 @@ from datetime import datetime
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class ContentItem:
-    """A piece of content from any platform."""
+    """A piece of content from any platform.
+
+    Slotted: fetches build thousands of these, and no per-instance __dict__
+    keeps them small.
+    """
 
     platform: str
     platform_id: str  # Tweet ID, video ID, etc.
@@ -4,6 +4,7 @@ Uses Gemini's ability to directly process YouTube URLs and audio files
 for summarization, bypassing the need for transcription services.
 """
 
+import asyncio
 import logging
 from datetime import datetime
 from pathlib import Path
@@ -87,7 +88,7 @@ Provide:
 Video: {video_url}"""
 
         try:
-            response = self._model.generate_content(prompt)
+            response = await asyncio.to_thread(self._model.generate_content, prompt)
 
             return {
                 "video_url": video_url,
@@ -161,14 +162,16 @@ Provide:
 
         try:
             # Upload audio file to Gemini
-            audio_file = genai.upload_file(str(audio_path))
+            audio_file = await asyncio.to_thread(genai.upload_file, str(audio_path))
 
             # Generate summary
-            response = self._model.generate_content([prompt, audio_file])
+            response = await asyncio.to_thread(
+                self._model.generate_content, [prompt, audio_file]
+            )
 
             # Clean up uploaded file
             try:
-                audio_file.delete()
+                await asyncio.to_thread(audio_file.delete)
             except Exception:
                 pass  # Non-critical
 
@@ -224,7 +227,7 @@ Provide:
 Audio: {audio_url}"""
 
         try:
-            response = self._model.generate_content(prompt)
+            response = await asyncio.to_thread(self._model.generate_content, prompt)
 
             return {
                 "audio_url": audio_url,
@@ -263,7 +266,7 @@ For each topic, provide:
 Content: {content_url}"""
 
         try:
-            response = self._model.generate_content(prompt)
+            response = await asyncio.to_thread(self._model.generate_content, prompt)
             return {
                 "content_url": content_url,
                 "topics": response.text,
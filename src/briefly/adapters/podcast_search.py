@@ -14,6 +14,28 @@ logger = logging.getLogger(__name__)
 # iTunes Search API endpoint (free, no auth required)
 ITUNES_SEARCH_URL = "https://itunes.apple.com/search"
 
+# Shared client so back-to-back lookups reuse the iTunes keep-alive connection
+_http_client: httpx.AsyncClient | None = None
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    """Get the shared HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20),
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client. Call on app shutdown."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 async def search_podcasts(query: str, limit: int = 10) -> list[dict[str, Any]]:
     """
@@ -34,42 +56,42 @@ async def search_podcasts(query: str, limit: int = 10) -> list[dict[str, Any]]:
         - genres: List of genre names
     """
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                ITUNES_SEARCH_URL,
-                params={
-                    "term": query,
-                    "media": "podcast",
-                    "limit": min(limit, 200),  # iTunes caps at 200
-                },
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            podcasts = []
-            for result in data.get("results", []):
-                # Extract relevant fields
-                podcast = {
-                    "name": result.get("collectionName", ""),
-                    "author": result.get("artistName", ""),
-                    "feed_url": result.get("feedUrl", ""),
-                    "artwork": result.get("artworkUrl600")
-                        or result.get("artworkUrl100")
-                        or result.get("artworkUrl60", ""),
-                    "description": result.get("description", "")
-                        or result.get("collectionName", ""),
-                    "episode_count": result.get("trackCount", 0),
-                    "genres": result.get("genres", []),
-                    "collection_id": result.get("collectionId"),
-                    "itunes_url": result.get("collectionViewUrl", ""),
-                }
-
-                # Skip podcasts without a feed URL (can't subscribe)
-                if podcast["feed_url"]:
-                    podcasts.append(podcast)
-
-            logger.info(f"Found {len(podcasts)} podcasts for query '{query}'")
-            return podcasts
+        client = _get_http_client()
+        response = await client.get(
+            ITUNES_SEARCH_URL,
+            params={
+                "term": query,
+                "media": "podcast",
+                "limit": min(limit, 200),  # iTunes caps at 200
+            },
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        podcasts = []
+        for result in data.get("results", []):
+            # Extract relevant fields
+            podcast = {
+                "name": result.get("collectionName", ""),
+                "author": result.get("artistName", ""),
+                "feed_url": result.get("feedUrl", ""),
+                "artwork": result.get("artworkUrl600")
+                    or result.get("artworkUrl100")
+                    or result.get("artworkUrl60", ""),
+                "description": result.get("description", "")
+                    or result.get("collectionName", ""),
+                "episode_count": result.get("trackCount", 0),
+                "genres": result.get("genres", []),
+                "collection_id": result.get("collectionId"),
+                "itunes_url": result.get("collectionViewUrl", ""),
+            }
+
+            # Skip podcasts without a feed URL (can't subscribe)
+            if podcast["feed_url"]:
+                podcasts.append(podcast)
+
+        logger.info(f"Found {len(podcasts)} podcasts for query '{query}'")
+        return podcasts
 
     except httpx.HTTPStatusError as e:
         logger.error(f"iTunes API HTTP error: {e}")
@@ -93,29 +115,29 @@ async def get_podcast_by_id(collection_id: int) -> dict[str, Any] | None:
         Podcast dict or None if not found
     """
     try:
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            response = await client.get(
-                "https://itunes.apple.com/lookup",
-                params={"id": collection_id},
-            )
-            response.raise_for_status()
-            data = response.json()
-
-            results = data.get("results", [])
-            if results:
-                result = results[0]
-                return {
-                    "name": result.get("collectionName", ""),
-                    "author": result.get("artistName", ""),
-                    "feed_url": result.get("feedUrl", ""),
-                    "artwork": result.get("artworkUrl600", ""),
-                    "description": result.get("description", ""),
-                    "episode_count": result.get("trackCount", 0),
-                    "genres": result.get("genres", []),
-                    "collection_id": result.get("collectionId"),
-                    "itunes_url": result.get("collectionViewUrl", ""),
-                }
-            return None
+        client = _get_http_client()
+        response = await client.get(
+            "https://itunes.apple.com/lookup",
+            params={"id": collection_id},
+        )
+        response.raise_for_status()
+        data = response.json()
+
+        results = data.get("results", [])
+        if results:
+            result = results[0]
+            return {
+                "name": result.get("collectionName", ""),
+                "author": result.get("artistName", ""),
+                "feed_url": result.get("feedUrl", ""),
+                "artwork": result.get("artworkUrl600", ""),
+                "description": result.get("description", ""),
+                "episode_count": result.get("trackCount", 0),
+                "genres": result.get("genres", []),
+                "collection_id": result.get("collectionId"),
+                "itunes_url": result.get("collectionViewUrl", ""),
+            }
+        return None
 
     except Exception as e:
         logger.error(f"Error looking up podcast {collection_id}: {e}")
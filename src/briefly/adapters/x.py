@@ -1,9 +1,11 @@
 """X (Twitter) adapter with fallback strategies."""
 
 import asyncio
+import functools
 import logging
 import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any
 
@@ -16,6 +18,30 @@ from briefly.core.cache import get_user_cache
 
 logger = logging.getLogger(__name__)
 
+# Dedicated pool for the sync tweepy client so list setup doesn't queue
+# behind (or starve) other blocking work on the default executor
+TWEEPY_MAX_WORKERS = 16
+_tweepy_executor: ThreadPoolExecutor | None = None
+
+
+def _get_tweepy_executor() -> ThreadPoolExecutor:
+    """Get the shared tweepy executor, creating it on first use."""
+    global _tweepy_executor
+    if _tweepy_executor is None:
+        _tweepy_executor = ThreadPoolExecutor(
+            max_workers=TWEEPY_MAX_WORKERS,
+            thread_name_prefix="tweepy",
+        )
+    return _tweepy_executor
+
+
+def shutdown_tweepy_executor() -> None:
+    """Shut down the shared tweepy executor. Call on app shutdown."""
+    global _tweepy_executor
+    if _tweepy_executor is not None:
+        _tweepy_executor.shutdown(wait=False, cancel_futures=True)
+        _tweepy_executor = None
+
 
 class XAdapter(BaseAdapter):
     """
@@ -145,17 +171,10 @@ class XAdapter(BaseAdapter):
             return self._has_write_permissions
 
         try:
-            def create_and_delete():
-                resp = self._bot_client.create_list(
-                    name=f"briefly_test_{uuid.uuid4().hex[:4]}",
-                    private=True,
-                )
-                list_id = resp.data["id"]
-                self._bot_client.delete_list(id=list_id)
-                return True
-
-            loop = asyncio.get_event_loop()
-            self._has_write_permissions = await loop.run_in_executor(None, create_and_delete)
+            loop = asyncio.get_running_loop()
+            self._has_write_permissions = await loop.run_in_executor(
+                _get_tweepy_executor(), self._probe_write_permissions
+            )
             logger.info("Write permissions confirmed")
         except tweepy.errors.Forbidden:
             logger.warning("No write permissions - using direct timeline fetching")
@@ -166,6 +185,15 @@ class XAdapter(BaseAdapter):
 
         return self._has_write_permissions
 
+    def _probe_write_permissions(self) -> bool:
+        """Create and immediately delete a throwaway list."""
+        resp = self._bot_client.create_list(
+            name=f"briefly_test_{uuid.uuid4().hex[:4]}",
+            private=True,
+        )
+        self._bot_client.delete_list(id=resp.data["id"])
+        return True
+
     async def _fetch_user_timeline(
         self,
         user_id: str,
@@ -300,19 +328,19 @@ class XAdapter(BaseAdapter):
         items = []
 
         try:
-            def fetch_sync():
-                return self._bot_client.get_list_tweets(
-                    id=list_id,
-                    max_results=100,
-                    start_time=start_time.isoformat(),
-                    end_time=end_time.isoformat(),
-                    tweet_fields=["created_at", "public_metrics", "author_id"],
-                    expansions=["author_id"],
-                    user_fields=["username", "name"],
-                )
+            fetch = functools.partial(
+                self._bot_client.get_list_tweets,
+                id=list_id,
+                max_results=100,
+                start_time=start_time.isoformat(),
+                end_time=end_time.isoformat(),
+                tweet_fields=["created_at", "public_metrics", "author_id"],
+                expansions=["author_id"],
+                user_fields=["username", "name"],
+            )
 
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(None, fetch_sync)
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(_get_tweepy_executor(), fetch)
 
             if not response.data:
                 return items
@@ -362,20 +390,21 @@ class XAdapter(BaseAdapter):
         user_ids = [str(u["id"]) for u in user_lookup.values()]
 
         logger.info("Creating temporary list...")
-        loop = asyncio.get_event_loop()
-        list_id = await loop.run_in_executor(None, self._create_temp_list)
+        loop = asyncio.get_running_loop()
+        executor = _get_tweepy_executor()
+        list_id = await loop.run_in_executor(executor, self._create_temp_list)
         logger.info(f"Created list {list_id}")
 
         try:
             logger.info(f"Adding {len(user_ids)} members to list...")
-            await loop.run_in_executor(None, self._add_list_members, list_id, user_ids)
+            await loop.run_in_executor(executor, self._add_list_members, list_id, user_ids)
 
             logger.info("Fetching list timeline...")
             return await self._fetch_list_tweets(list_id, start_time, end_time)
 
         finally:
             logger.info(f"Deleting temporary list {list_id}...")
-            await loop.run_in_executor(None, self._delete_list, list_id)
+            await loop.run_in_executor(executor, self._delete_list, list_id)
 
     async def _fetch_via_persistent_list(
         self,
@@ -400,7 +400,7 @@ class YouTubeAdapter(BaseAdapter):
                     # Lazy import to avoid circular dependency
                     from briefly.services.transcripts import get_transcript_store
                     store = get_transcript_store()
-                    cached_summary = store.get_summary(video_id)
+                    cached_summary = await store.get_summary(video_id)
                     transcript_content = ""
                     has_transcript = False
                     transcript_chars = 0
@@ -421,7 +421,7 @@ class YouTubeAdapter(BaseAdapter):
                             transcript_chars = len(transcript)
                             has_transcript = True
                             # Store the full transcript for background processing
-                            store.save_transcript(
+                            await store.save_transcript(
                                 video_id=video_id,
                                 transcript=transcript,
                                 video_title=snippet['title'],
@@ -8,8 +8,11 @@ from fastapi.responses import HTMLResponse
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
 
+from briefly.adapters.podcast_search import close_http_client
+from briefly.adapters.x import shutdown_tweepy_executor
 from briefly.api.routes import sources, briefings, health, search, jobs, settings, llm, source_search
 from briefly.services.jobs import get_job_service
+from briefly.services.x_lists import close_list_manager
 
 
 @asynccontextmanager
@@ -19,6 +22,10 @@ async def lifespan(app: FastAPI):
     job_service = get_job_service()
     await job_service.init()
     yield
+    await job_service.close()
+    await close_http_client()
+    await close_list_manager()
+    shutdown_tweepy_executor()
 
 
 app = FastAPI(
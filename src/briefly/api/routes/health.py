@@ -1,18 +1,17 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Depends
 
 from briefly.core.config import get_settings
-from briefly.services.jobs import get_job_service
+from briefly.services.jobs import JobService, get_job_service
 
 router = APIRouter()
 
 
 @router.get("/health")
-async def health_check():
+async def health_check(job_service: JobService = Depends(get_job_service)):
     """Basic health check with environment info."""
     settings = get_settings()
-    job_service = get_job_service()
 
     return {
         "status": "ok",
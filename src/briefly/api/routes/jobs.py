@@ -15,7 +15,7 @@ from datetime import datetime
 from typing import Any, Optional
 
 import httpx
-from fastapi import APIRouter, HTTPException, BackgroundTasks
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
 from pydantic import BaseModel, Field
 
 from briefly.core.config import get_settings
@@ -84,21 +84,7 @@ class N8NCompleteRequest(BaseModel):
 
 def _job_to_response(job: Job) -> JobResponse:
     """Convert Job dataclass to response model."""
-    return JobResponse(
-        id=job.id,
-        type=job.type,
-        status=job.status,
-        created_at=job.created_at.isoformat() if job.created_at else None,
-        started_at=job.started_at.isoformat() if job.started_at else None,
-        completed_at=job.completed_at.isoformat() if job.completed_at else None,
-        n8n_execution_id=job.n8n_execution_id,
-        n8n_workflow_id=job.n8n_workflow_id,
-        progress=job.progress,
-        input=job.input,
-        output=job.output,
-        error=job.error,
-        source=job.source,
-    )
+    return JobResponse(**job.to_dict())
 
 
 # Job Management Endpoints
@@ -108,6 +94,7 @@ def _job_to_response(job: Job) -> JobResponse:
 async def create_job(
     req: CreateJobRequest,
     background_tasks: BackgroundTasks,
+    service: JobService = Depends(get_job_service),
 ) -> CreateJobResponse:
     """
     Create a new job.
@@ -115,8 +102,6 @@ async def create_job(
     If delegate_to_n8n is True, triggers the n8n webhook and tracks the execution.
     Otherwise, creates a local job that can be processed by background tasks.
     """
-    service = get_job_service()
-
     source = "n8n" if req.delegate_to_n8n else "local"
     job = await service.create(req.type, req.params, source=source)
 
@@ -228,13 +213,14 @@ async def create_job(
 
 
 @router.get("/active", response_model=Optional[JobResponse])
-async def get_active_job() -> Optional[JobResponse]:
+async def get_active_job(
+    service: JobService = Depends(get_job_service),
+) -> Optional[JobResponse]:
     """
     Get the currently running job (if any).
 
     Used by the frontend to reconnect to a running job after page reload.
     """
-    service = get_job_service()
     job = await service.get_active()
 
     if not job:
@@ -247,6 +233,7 @@ async def get_active_job() -> Optional[JobResponse]:
 async def list_jobs(
     limit: int = 20,
     status: Optional[str] = None,
+    service: JobService = Depends(get_job_service),
 ) -> list[JobResponse]:
     """
     List recent jobs.
@@ -255,7 +242,6 @@ async def list_jobs(
         limit: Maximum number of jobs to return (default 20)
         status: Filter by status (optional)
     """
-    service = get_job_service()
     jobs = await service.list_recent(limit=limit)
 
     # Filter by status if provided
@@ -266,13 +252,15 @@ async def list_jobs(
 
 
 @router.get("/{job_id}", response_model=JobResponse)
-async def get_job(job_id: str) -> JobResponse:
+async def get_job(
+    job_id: str,
+    service: JobService = Depends(get_job_service),
+) -> JobResponse:
     """
     Get job status and progress by ID.
 
     Used for polling job progress from the frontend.
     """
-    service = get_job_service()
     job = await service.get(job_id)
 
     if not job:
@@ -288,14 +276,15 @@ n8n_router = APIRouter()
 
 
 @n8n_router.post("/progress")
-async def n8n_progress_webhook(req: N8NProgressRequest) -> dict[str, str]:
+async def n8n_progress_webhook(
+    req: N8NProgressRequest,
+    service: JobService = Depends(get_job_service),
+) -> dict[str, str]:
     """
     Webhook for n8n to push progress updates.
 
     Called by n8n workflows to update job progress during execution.
     """
-    service = get_job_service()
-
     job = await service.get(req.job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -306,14 +295,15 @@ async def n8n_progress_webhook(req: N8NProgressRequest) -> dict[str, str]:
 
 
 @n8n_router.post("/complete")
-async def n8n_complete_webhook(req: N8NCompleteRequest) -> dict[str, str]:
+async def n8n_complete_webhook(
+    req: N8NCompleteRequest,
+    service: JobService = Depends(get_job_service),
+) -> dict[str, str]:
     """
     Webhook for n8n to mark job as complete.
 
     Called by n8n workflows when execution finishes (success or failure).
     """
-    service = get_job_service()
-
     job = await service.get(req.job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
@@ -402,9 +402,10 @@ async def init_x_list(req: XListInitRequest | None = None) -> dict:
     """
     list_name = req.list_name if req else "briefly_sources"
 
-    # Import here to avoid circular imports and allow custom list name
-    from briefly.services.x_lists import XListManager
-    list_manager = XListManager(list_name=list_name)
+    # Import here to avoid circular imports. Goes through the singleton so no
+    # second manager opens its own session or overwrites the shared state.
+    from briefly.services.x_lists import get_list_manager_for
+    list_manager = await get_list_manager_for(list_name)
 
     try:
         list_id = await list_manager.ensure_list_exists()
@@ -486,7 +487,9 @@ async def sync_x_list(req: XListSyncRequest | None = None) -> dict:
         list_id = await list_manager.ensure_list_exists()
 
         # Sync sources
-        result = await list_manager.sync_sources(x_identifiers)
+        result = await list_manager.sync_sources(
+            x_identifiers, force=req.force if req else False
+        )
 
         # Update sources.json with sync status
         from datetime import datetime as dt
@@ -89,11 +89,12 @@ class XUserCache:
 
     def set_many(self, users: dict[str, dict[str, Any]]):
         """Cache multiple users at once."""
+        cached_at = datetime.now().isoformat()
         for username, data in users.items():
             key = username.lower().lstrip("@")
             self._cache[key] = {
                 "data": data,
-                "cached_at": datetime.now().isoformat(),
+                "cached_at": cached_at,
             }
         self._save()
         logger.info(f"Cached {len(users)} users")
@@ -2,6 +2,8 @@
 
 from contextlib import asynccontextmanager
 
+from pgvector.asyncpg import register_vector
+from sqlalchemy import event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
@@ -26,6 +28,20 @@ engine = create_async_engine(
     pool_pre_ping=True,
 )
 
+
+@event.listens_for(engine.sync_engine, "connect")
+def _register_vector_codec(dbapi_connection, connection_record) -> None:
+    """Send/receive pgvector values in binary instead of parsing text casts."""
+    dbapi_connection.run_async(_register_vector_types)
+
+
+async def _register_vector_types(conn) -> None:
+    # The first connection (the one init_db uses to create the extension) can
+    # predate the vector type; it is skipped here and dropped by init_db.
+    if await conn.fetchval("SELECT to_regtype('public.vector') IS NOT NULL"):
+        await register_vector(conn)
+
+
 async_session_maker = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -52,6 +68,8 @@ async def init_db() -> None:
         # Enable pgvector extension
         await conn.execute("CREATE EXTENSION IF NOT EXISTS vector")
         await conn.run_sync(Base.metadata.create_all)
+    # Reconnect so every pooled connection picks up the vector codec
+    await engine.dispose()
 
 
 @asynccontextmanager
@@ -0,0 +1,11 @@
+-- Migration: 002_hnsw_index
+-- Description: Replace the IVFFlat embedding index with HNSW for ANN search
+-- Created: 2026-10-16
+
+-- HNSW needs no training data (unlike IVFFlat's lists) and keeps good recall
+-- as content_chunks grows. VectorStore.search sets hnsw.ef_search per query.
+DROP INDEX IF EXISTS idx_chunks_embedding;
+
+CREATE INDEX idx_chunks_embedding ON content_chunks
+    USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
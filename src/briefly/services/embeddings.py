@@ -19,6 +19,11 @@ class EmbeddingService:
         self._chunk_size = settings.chunk_size_tokens
         self._chunk_overlap = settings.chunk_overlap_tokens
 
+    @property
+    def model(self) -> str:
+        """Name of the embedding model in use."""
+        return self._model
+
     def count_tokens(self, text: str) -> int:
         """Count tokens in text."""
         return len(self._tokenizer.encode(text))
@@ -3,7 +3,7 @@ Job persistence service with PostgreSQL (prod) and SQLite (dev) support.
 
 Database selection:
 - If DATABASE_URL env var is set → PostgreSQL (async with asyncpg)
-- Otherwise → SQLite (sync, file-based at .cache/jobs.db)
+- Otherwise → SQLite (file-based at .cache/jobs.db, run in worker threads)
 
 Usage:
     service = JobService()
@@ -16,15 +16,31 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import json
 import os
 import sqlite3
-from dataclasses import asdict, dataclass
+import threading
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from enum import Enum
 from pathlib import Path
-from typing import Any, Optional, Protocol
-from uuid import uuid4
+from typing import Any, Optional, Protocol, TypeVar
+from uuid import UUID, uuid4
+
+T = TypeVar("T")
+
+# Compact, preconstructed encoder: json.dumps builds a new encoder on every
+# call whenever non-default options like separators are passed
+_dump_json = json.JSONEncoder(separators=(",", ":")).encode
+
+
+async def _init_pg_connection(conn) -> None:
+    """Encode/decode jsonb as Python dicts (asyncpg passes raw text by default)."""
+    await conn.set_type_codec(
+        "jsonb", encoder=_dump_json, decoder=json.loads, schema="pg_catalog"
+    )
 
 
 class JobStatus(str, Enum):
@@ -59,28 +75,104 @@ class Job:
     error: Optional[str] = None
     source: str = "local"
 
+    @classmethod
+    def new(
+        cls,
+        job_type: str,
+        params: Optional[dict[str, Any]] = None,
+        source: str = "local",
+    ) -> Job:
+        """Build a pending job with a fresh ID (not yet persisted)."""
+        return cls(
+            id=str(uuid4()),
+            type=job_type,
+            status=JobStatus.PENDING.value,
+            created_at=datetime.now(timezone.utc),
+            input=params,
+            source=source,
+        )
+
     def to_dict(self) -> dict[str, Any]:
-        """Convert to dict for JSON serialization."""
+        """Convert to dict for JSON serialization (shallow; nested dicts are shared)."""
         return {
-            **asdict(self),
+            **self.__dict__,
             "created_at": self.created_at.isoformat() if self.created_at else None,
             "started_at": self.started_at.isoformat() if self.started_at else None,
             "completed_at": self.completed_at.isoformat() if self.completed_at else None,
         }
 
 
+# Insert statements shared by insert_job/insert_jobs. Kept as constants so
+# every call passes the identical string (sqlite3's statement cache is keyed
+# on it); both take the parameters from _insert_params.
+_PG_INSERT_JOB = """
+    INSERT INTO jobs (id, type, status, created_at, input, source)
+    VALUES ($1::uuid, $2, $3, $4, $5, $6)
+"""
+_SQLITE_INSERT_JOB = """
+    INSERT INTO jobs (id, type, status, created_at, input, source)
+    VALUES (?, ?, ?, ?, ?, ?)
+"""
+
+
+# Full SQLite schema, applied as one script by SQLiteBackend.init_schema
+_SQLITE_SCHEMA = """
+    CREATE TABLE IF NOT EXISTS jobs (
+        id TEXT PRIMARY KEY,
+        type TEXT NOT NULL,
+        status TEXT NOT NULL,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        started_at TIMESTAMP,
+        completed_at TIMESTAMP,
+        n8n_execution_id TEXT,
+        n8n_workflow_id TEXT,
+        progress JSON,
+        input JSON,
+        output JSON,
+        error TEXT,
+        source TEXT DEFAULT 'local'
+    );
+    CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status);
+    CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at DESC);
+    CREATE INDEX IF NOT EXISTS idx_jobs_n8n ON jobs(n8n_execution_id);
+"""
+
+
+def _parse_sqlite_dt(value: str | None) -> Optional[datetime]:
+    """Parse an ISO-8601 timestamp stored by the SQLite backend."""
+    if not value:
+        return None
+    return datetime.fromisoformat(value)
+
+
+def _insert_params(job: Job) -> tuple[Any, ...]:
+    return (
+        job.id,
+        job.type,
+        job.status,
+        job.created_at,
+        job.input or None,
+        job.source,
+    )
+
+
 class DatabaseBackend(Protocol):
     """Protocol for database backends (PostgreSQL/SQLite)."""
 
     async def init_schema(self) -> None: ...
     async def insert_job(self, job: Job) -> None: ...
+    async def insert_jobs(self, jobs: list[Job]) -> None: ...
     async def get_job(self, job_id: str) -> Optional[Job]: ...
+    async def get_jobs(self, job_ids: list[str]) -> dict[str, Job]: ...
+    async def get_statuses(self, job_ids: list[str]) -> dict[str, str]: ...
+    async def count_by_status(self) -> dict[str, int]: ...
     async def get_active_job(self) -> Optional[Job]: ...
     async def update_progress(self, job_id: str, progress: dict[str, Any]) -> None: ...
     async def update_status(self, job_id: str, status: str) -> None: ...
     async def complete_job(self, job_id: str, output: dict[str, Any]) -> None: ...
     async def fail_job(self, job_id: str, error: str) -> None: ...
     async def list_recent(self, limit: int) -> list[Job]: ...
+    async def close(self) -> None: ...
 
 
 class PostgreSQLBackend:
@@ -94,7 +186,9 @@ class PostgreSQLBackend:
         if self._pool is None:
             import asyncpg
 
-            self._pool = await asyncpg.create_pool(self.database_url)
+            self._pool = await asyncpg.create_pool(
+                self.database_url, init=_init_pg_connection
+            )
         return self._pool
 
     async def init_schema(self) -> None:
@@ -133,18 +227,12 @@ class PostgreSQLBackend:
     async def insert_job(self, job: Job) -> None:
         pool = await self._get_pool()
         async with pool.acquire() as conn:
-            await conn.execute(
-                """
-                INSERT INTO jobs (id, type, status, created_at, input, source)
-                VALUES ($1::uuid, $2, $3, $4, $5, $6)
-                """,
-                job.id,
-                job.type,
-                job.status,
-                job.created_at,
-                json.dumps(job.input) if job.input else None,
-                job.source,
-            )
+            await conn.execute(_PG_INSERT_JOB, *_insert_params(job))
+
+    async def insert_jobs(self, jobs: list[Job]) -> None:
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            await conn.executemany(_PG_INSERT_JOB, map(_insert_params, jobs))
 
     async def get_job(self, job_id: str) -> Optional[Job]:
         pool = await self._get_pool()
@@ -154,6 +242,61 @@ class PostgreSQLBackend:
             )
             return self._row_to_job(row) if row else None
 
+    @staticmethod
+    def _valid_uuids(job_ids: list[str]) -> dict[str, str]:
+        # Malformed IDs can't match a UUID column and would fail the cast.
+        # Maps each requested ID to its canonical form, so results can be
+        # keyed by the caller's spelling (e.g. uppercase or braced).
+        valid_ids = {}
+        for job_id in job_ids:
+            try:
+                valid_ids[job_id] = str(UUID(job_id))
+            except ValueError:
+                continue
+        return valid_ids
+
+    async def get_jobs(self, job_ids: list[str]) -> dict[str, Job]:
+        valid_ids = self._valid_uuids(job_ids)
+        if not valid_ids:
+            return {}
+
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT * FROM jobs WHERE id = ANY($1::uuid[])",
+                list(set(valid_ids.values())),
+            )
+        jobs = {job.id: job for job in map(self._row_to_job, rows)}
+        return {
+            job_id: jobs[uuid] for job_id, uuid in valid_ids.items() if uuid in jobs
+        }
+
+    async def get_statuses(self, job_ids: list[str]) -> dict[str, str]:
+        valid_ids = self._valid_uuids(job_ids)
+        if not valid_ids:
+            return {}
+
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT id, status FROM jobs WHERE id = ANY($1::uuid[])",
+                list(set(valid_ids.values())),
+            )
+        statuses = {str(r["id"]): r["status"] for r in rows}
+        return {
+            job_id: statuses[uuid]
+            for job_id, uuid in valid_ids.items()
+            if uuid in statuses
+        }
+
+    async def count_by_status(self) -> dict[str, int]:
+        pool = await self._get_pool()
+        async with pool.acquire() as conn:
+            rows = await conn.fetch(
+                "SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"
+            )
+            return {r["status"]: r["n"] for r in rows}
+
     async def get_active_job(self) -> Optional[Job]:
         pool = await self._get_pool()
         async with pool.acquire() as conn:
@@ -172,7 +315,7 @@ class PostgreSQLBackend:
                 UPDATE jobs SET progress = $1, status = 'running',
                 started_at = COALESCE(started_at, NOW()) WHERE id = $2::uuid
                 """,
-                json.dumps(progress),
+                progress,
                 job_id,
             )
 
@@ -193,7 +336,7 @@ class PostgreSQLBackend:
                 UPDATE jobs SET status = 'completed', completed_at = NOW(),
                 output = $1 WHERE id = $2::uuid
                 """,
-                json.dumps(output),
+                output,
                 job_id,
             )
 
@@ -217,6 +360,11 @@ class PostgreSQLBackend:
             )
             return [self._row_to_job(r) for r in rows]
 
+    async def close(self) -> None:
+        if self._pool is not None:
+            await self._pool.close()
+            self._pool = None
+
     def _row_to_job(self, row) -> Job:
         return Job(
             id=str(row["id"]),
@@ -238,143 +386,209 @@ class PostgreSQLBackend:
 class SQLiteBackend:
     """SQLite backend for development and testing."""
 
-    def __init__(self, db_path: Path):
+    # Bump when _SQLITE_SCHEMA changes (stored in PRAGMA user_version)
+    SCHEMA_VERSION = 1
+
+    def __init__(self, db_path: Path | str):
+        """
+        Args:
+            db_path: Database file, or a SQLite URI such as
+                "file:jobs?mode=memory&cache=shared" for an in-memory DB
+                (kept alive for as long as this backend's connection is open).
+        """
         self.db_path = db_path
-        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._uri = isinstance(db_path, str) and db_path.startswith("file:")
+        if not self._uri:
+            self.db_path = Path(db_path)
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn: Optional[sqlite3.Connection] = None
+        # sqlite3 calls run on worker threads; one at a time on the shared connection
+        self._lock = threading.Lock()
 
     def _get_conn(self) -> sqlite3.Connection:
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        # One long-lived connection; `with conn:` still commits per operation
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                self.db_path,
+                uri=self._uri,
+                timeout=5.0,
+                check_same_thread=False,
+            )
+            self._conn.row_factory = sqlite3.Row
+            # WAL lets the dashboard read job progress while a worker writes it;
+            # under WAL, NORMAL sync skips the fsync on every commit and stays
+            # consistent (a crash can only lose the last few commits)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        return self._conn
+
+    def _call(self, op: Callable[[sqlite3.Connection], T]) -> T:
+        with self._lock:
+            conn = self._get_conn()
+            with conn:
+                return op(conn)
+
+    async def _run(self, op: Callable[[sqlite3.Connection], T]) -> T:
+        """Run op(conn) in a worker thread so disk I/O never blocks the event loop."""
+        return await asyncio.to_thread(self._call, op)
+
+    async def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def __aenter__(self) -> SQLiteBackend:
+        await self.init_schema()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
 
     async def init_schema(self) -> None:
-        with self._get_conn() as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS jobs (
-                    id TEXT PRIMARY KEY,
-                    type TEXT NOT NULL,
-                    status TEXT NOT NULL,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    started_at TIMESTAMP,
-                    completed_at TIMESTAMP,
-                    n8n_execution_id TEXT,
-                    n8n_workflow_id TEXT,
-                    progress JSON,
-                    input JSON,
-                    output JSON,
-                    error TEXT,
-                    source TEXT DEFAULT 'local'
-                )
-            """)
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs(status)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs(created_at DESC)"
-            )
-            conn.execute(
-                "CREATE INDEX IF NOT EXISTS idx_jobs_n8n ON jobs(n8n_execution_id)"
-            )
+        await self._run(self._init_schema)
+
+    def _init_schema(self, conn: sqlite3.Connection) -> None:
+        # Already at this schema version: skip re-running the DDL
+        (version,) = conn.execute("PRAGMA user_version").fetchone()
+        if version >= self.SCHEMA_VERSION:
+            return
+
+        # Whole schema in one script and one transaction
+        conn.executescript(
+            f"BEGIN;{_SQLITE_SCHEMA}PRAGMA user_version = {self.SCHEMA_VERSION};COMMIT;"
+        )
+
+    @staticmethod
+    def _insert_params(job: Job) -> tuple[Any, ...]:
+        # Timestamps are stored as ISO-8601 text and dicts as JSON text
+        return (
+            job.id,
+            job.type,
+            job.status,
+            job.created_at.isoformat(),
+            _dump_json(job.input) if job.input else None,
+            job.source,
+        )
 
     async def insert_job(self, job: Job) -> None:
-        with self._get_conn() as conn:
-            conn.execute(
-                """
-                INSERT INTO jobs (id, type, status, created_at, input, source)
-                VALUES (?, ?, ?, ?, ?, ?)
-                """,
-                (
-                    job.id,
-                    job.type,
-                    job.status,
-                    job.created_at.isoformat(),
-                    json.dumps(job.input) if job.input else None,
-                    job.source,
-                ),
-            )
+        params = self._insert_params(job)
+        await self._run(lambda conn: conn.execute(_SQLITE_INSERT_JOB, params))
+
+    async def insert_jobs(self, jobs: list[Job]) -> None:
+        rows = list(map(self._insert_params, jobs))
+        await self._run(lambda conn: conn.executemany(_SQLITE_INSERT_JOB, rows))
 
     async def get_job(self, job_id: str) -> Optional[Job]:
-        with self._get_conn() as conn:
-            row = conn.execute(
+        row = await self._run(
+            lambda conn: conn.execute(
                 "SELECT * FROM jobs WHERE id = ?", (job_id,)
             ).fetchone()
-            return self._row_to_job(row) if row else None
+        )
+        return self._row_to_job(row) if row else None
+
+    async def get_jobs(self, job_ids: list[str]) -> dict[str, Job]:
+        if not job_ids:
+            return {}
+        # One bound JSON array instead of a variable-length IN (?, ?, ...)
+        ids_json = _dump_json(job_ids)
+        rows = await self._run(
+            lambda conn: conn.execute(
+                "SELECT * FROM jobs WHERE id IN (SELECT value FROM json_each(?))",
+                (ids_json,),
+            ).fetchall()
+        )
+        return {job.id: job for job in map(self._row_to_job, rows)}
+
+    async def get_statuses(self, job_ids: list[str]) -> dict[str, str]:
+        if not job_ids:
+            return {}
+        ids_json = _dump_json(job_ids)
+        rows = await self._run(
+            lambda conn: conn.execute(
+                "SELECT id, status FROM jobs WHERE id IN (SELECT value FROM json_each(?))",
+                (ids_json,),
+            ).fetchall()
+        )
+        return {r["id"]: r["status"] for r in rows}
+
+    async def count_by_status(self) -> dict[str, int]:
+        rows = await self._run(
+            lambda conn: conn.execute(
+                "SELECT status, COUNT(*) AS n FROM jobs GROUP BY status"
+            ).fetchall()
+        )
+        return {r["status"]: r["n"] for r in rows}
 
     async def get_active_job(self) -> Optional[Job]:
-        with self._get_conn() as conn:
-            row = conn.execute("""
+        row = await self._run(
+            lambda conn: conn.execute("""
                 SELECT * FROM jobs WHERE status IN ('pending', 'running')
-                ORDER BY created_at DESC LIMIT 1
+                ORDER BY created_at DESC, rowid DESC LIMIT 1
             """).fetchone()
-            return self._row_to_job(row) if row else None
+        )
+        return self._row_to_job(row) if row else None
 
     async def update_progress(self, job_id: str, progress: dict[str, Any]) -> None:
-        with self._get_conn() as conn:
-            conn.execute(
+        params = (_dump_json(progress), datetime.now(timezone.utc).isoformat(), job_id)
+        await self._run(
+            lambda conn: conn.execute(
                 """
                 UPDATE jobs SET progress = ?, status = 'running',
                 started_at = COALESCE(started_at, ?) WHERE id = ?
                 """,
-                (
-                    json.dumps(progress),
-                    datetime.now(timezone.utc).isoformat(),
-                    job_id,
-                ),
+                params,
             )
+        )
 
     async def update_status(self, job_id: str, status: str) -> None:
-        with self._get_conn() as conn:
-            conn.execute(
+        await self._run(
+            lambda conn: conn.execute(
                 "UPDATE jobs SET status = ? WHERE id = ?",
                 (status, job_id),
             )
+        )
 
     async def complete_job(self, job_id: str, output: dict[str, Any]) -> None:
-        with self._get_conn() as conn:
-            conn.execute(
+        params = (datetime.now(timezone.utc).isoformat(), _dump_json(output), job_id)
+        await self._run(
+            lambda conn: conn.execute(
                 """
                 UPDATE jobs SET status = 'completed', completed_at = ?, output = ?
                 WHERE id = ?
                 """,
-                (
-                    datetime.now(timezone.utc).isoformat(),
-                    json.dumps(output),
-                    job_id,
-                ),
+                params,
             )
+        )
 
     async def fail_job(self, job_id: str, error: str) -> None:
-        with self._get_conn() as conn:
-            conn.execute(
+        params = (datetime.now(timezone.utc).isoformat(), error, job_id)
+        await self._run(
+            lambda conn: conn.execute(
                 """
                 UPDATE jobs SET status = 'failed', completed_at = ?, error = ?
                 WHERE id = ?
                 """,
-                (datetime.now(timezone.utc).isoformat(), error, job_id),
+                params,
             )
+        )
 
     async def list_recent(self, limit: int = 20) -> list[Job]:
-        with self._get_conn() as conn:
-            rows = conn.execute(
-                "SELECT * FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)
+        rows = await self._run(
+            lambda conn: conn.execute(
+                "SELECT * FROM jobs ORDER BY created_at DESC, rowid DESC LIMIT ?", (limit,)
             ).fetchall()
-            return [self._row_to_job(r) for r in rows]
+        )
+        return [self._row_to_job(r) for r in rows]
 
     def _row_to_job(self, row: sqlite3.Row) -> Job:
-        def parse_dt(s: str | datetime | None) -> Optional[datetime]:
-            if not s:
-                return None
-            if isinstance(s, datetime):
-                return s
-            return datetime.fromisoformat(s.replace("Z", "+00:00"))
-
         return Job(
             id=row["id"],
             type=row["type"],
             status=row["status"],
-            created_at=parse_dt(row["created_at"]),
-            started_at=parse_dt(row["started_at"]),
-            completed_at=parse_dt(row["completed_at"]),
+            created_at=_parse_sqlite_dt(row["created_at"]),
+            started_at=_parse_sqlite_dt(row["started_at"]),
+            completed_at=_parse_sqlite_dt(row["completed_at"]),
             n8n_execution_id=row["n8n_execution_id"],
             n8n_workflow_id=row["n8n_workflow_id"],
             progress=json.loads(row["progress"]) if row["progress"] else None,
@@ -405,14 +619,26 @@ class JobService:
 
     _instance: Optional[JobService] = None
 
-    def __init__(self, database_url: Optional[str] = None):
-        url = database_url or DATABASE_URL
+    def __init__(
+        self,
+        database_url: Optional[str] = None,
+        sqlite_path: Path | str | None = None,
+    ):
+        """
+        Args:
+            database_url: PostgreSQL URL (defaults to the DATABASE_URL env var)
+            sqlite_path: SQLite file or URI, e.g.
+                "file:jobs?mode=memory&cache=shared" for a throwaway
+                in-memory store. Selects SQLite even if DATABASE_URL is set.
+        """
+        url = database_url or (None if sqlite_path else DATABASE_URL)
         if url:
             self._backend: DatabaseBackend = PostgreSQLBackend(url)
             self._db_type = "postgresql"
         else:
-            self._backend = SQLiteBackend(SQLITE_PATH)
+            self._backend = SQLiteBackend(sqlite_path or SQLITE_PATH)
             self._db_type = "sqlite"
+        self._initialized = False
 
     @classmethod
     def get_instance(cls) -> JobService:
@@ -431,8 +657,11 @@ class JobService:
         return self._db_type
 
     async def init(self) -> None:
-        """Initialize database schema. Call on app startup."""
+        """Initialize database schema. Call on app startup; repeat calls are no-ops."""
+        if self._initialized:
+            return
         await self._backend.init_schema()
+        self._initialized = True
 
     async def create(
         self,
@@ -441,21 +670,40 @@ class JobService:
         source: str = "local",
     ) -> Job:
         """Create a new job."""
-        job = Job(
-            id=str(uuid4()),
-            type=job_type,
-            status=JobStatus.PENDING.value,
-            created_at=datetime.now(timezone.utc),
-            input=params,
-            source=source,
-        )
+        job = Job.new(job_type, params, source)
         await self._backend.insert_job(job)
         return job
 
+    async def create_many(
+        self,
+        job_type: str,
+        params_list: list[Optional[dict[str, Any]]],
+        source: str = "local",
+    ) -> list[Job]:
+        """Create one job per params dict with a single batched insert."""
+        jobs = [Job.new(job_type, params, source) for params in params_list]
+        if jobs:
+            await self._backend.insert_jobs(jobs)
+        return jobs
+
     async def get(self, job_id: str) -> Optional[Job]:
         """Get job by ID."""
         return await self._backend.get_job(job_id)
 
+    async def get_many(self, job_ids: list[str]) -> dict[str, Optional[Job]]:
+        """Get several jobs in one query (None for unknown IDs)."""
+        jobs = await self._backend.get_jobs(job_ids)
+        return {job_id: jobs.get(job_id) for job_id in job_ids}
+
+    async def batch_status(self, job_ids: list[str]) -> dict[str, Optional[str]]:
+        """Get the status of several jobs in one query (None for unknown IDs)."""
+        statuses = await self._backend.get_statuses(job_ids)
+        return {job_id: statuses.get(job_id) for job_id in job_ids}
+
+    async def status_counts(self) -> dict[str, int]:
+        """Count jobs per status in one query (statuses with no jobs are absent)."""
+        return await self._backend.count_by_status()
+
     async def get_active(self) -> Optional[Job]:
         """Get currently running job if any."""
         return await self._backend.get_active_job()
@@ -480,6 +728,11 @@ class JobService:
         """List recent jobs."""
         return await self._backend.list_recent(limit)
 
+    async def close(self) -> None:
+        """Close database connections. Call on app shutdown."""
+        await self._backend.close()
+        self._initialized = False
+
 
 def get_job_service() -> JobService:
     """Get the job service singleton."""
@@ -1,5 +1,6 @@
 """AI summarization service using Grok."""
 
+import json
 import logging
 from openai import AsyncOpenAI
 
@@ -115,8 +116,8 @@ For each suggestion, provide:
 1. Username (real X accounts that exist and are active)
 2. Brief reason why they'd be relevant
 
-Respond in JSON format:
-[{{"username": "example", "reason": "Brief explanation"}}]
+Respond with a JSON object of the form:
+{{"recommendations": [{{"username": "example", "reason": "Brief explanation"}}]}}
 
 Only suggest accounts NOT in the current sources list."""
 
@@ -124,21 +125,13 @@ Only suggest accounts NOT in the current sources list."""
             response = await self._client.chat.completions.create(
                 model=self._model,
                 messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"},
                 temperature=0.8,
                 max_tokens=500,
             )
 
-            # Parse JSON from response
-            import json
-            text = response.choices[0].message.content
-            # Extract JSON if wrapped in markdown
-            if "```json" in text:
-                text = text.split("```json")[1].split("```")[0]
-            elif "```" in text:
-                text = text.split("```")[1].split("```")[0]
-
-            recommendations = json.loads(text.strip())
-            return recommendations[:max_recommendations]
+            data = json.loads(response.choices[0].message.content)
+            return data.get("recommendations", [])[:max_recommendations]
 
         except Exception as e:
             logger.error(f"Recommendation generation failed: {e}")
@@ -146,10 +139,9 @@ Only suggest accounts NOT in the current sources list."""
 
     def _format_items_for_prompt(self, items: list[ContentItem]) -> str:
         """Format content items for LLM prompt."""
-        lines = []
-        for i, item in enumerate(items, 1):
-            metrics_str = f"(likes: {item.metrics.get('like_count', 0)}, RTs: {item.metrics.get('retweet_count', 0)})"
-            lines.append(
-                f"{i}. @{item.source_identifier}: {item.content} {metrics_str}"
-            )
-        return "\n\n".join(lines)
+        return "\n\n".join(
+            f"{i}. @{item.source_identifier}: {item.content} "
+            f"(likes: {item.metrics.get('like_count', 0)}, "
+            f"RTs: {item.metrics.get('retweet_count', 0)})"
+            for i, item in enumerate(items, 1)
+        )
@@ -1,8 +1,13 @@
 """Transcript storage and processing service."""
 
+import asyncio
 import json
 import logging
 import hashlib
+import os
+import threading
+import uuid
+from collections.abc import Iterator
 from pathlib import Path
 from datetime import datetime, timezone
 from typing import Any
@@ -15,6 +20,50 @@ logger = logging.getLogger(__name__)
 
 # File-based storage for transcripts and summaries
 CACHE_DIR = Path(__file__).parent.parent.parent.parent / ".cache" / "transcripts"
+# Exact-match LLM response cache, keyed by SHA256 of model + prompt + params
+CHUNK_CACHE_DIR = CACHE_DIR / "chunks"
+# Index of video IDs with a transcript but no summary yet
+PENDING_INDEX_FILE = CACHE_DIR / "_pending.json"
+# Serializes read-modify-write of the pending index across store instances
+_pending_lock = threading.Lock()
+
+# Long-transcript reduce: up to this many chunks skip the dedicated reduce prompt
+SHORT_REDUCE_MAX_CHUNKS = 2
+# Above this many chunks, summaries are merged in groups before the final reduce
+TREE_REDUCE_MIN_CHUNKS = 8
+TREE_REDUCE_GROUP_SIZE = 4
+
+
+def _read_json(path: Path) -> Any:
+    """Decode a JSON file straight from bytes."""
+    return json.loads(path.read_bytes())
+
+
+def _write_json(path: Path, data: Any) -> None:
+    """Write compact JSON; transcripts are large and never read by hand."""
+    path.write_bytes(json.dumps(data, separators=(",", ":")).encode())
+
+
+def _iter_chunk_bounds(text: str, size: int) -> Iterator[tuple[int, int]]:
+    """
+    Yield (start, end) offsets splitting text into chunks of at most size chars.
+
+    Prefers to break after a sentence ('. ') within the last 500 chars of a chunk.
+    """
+    text_len = len(text)
+    start = 0
+    while start < text_len:
+        end = min(start + size, text_len)
+
+        # Try to break at a sentence boundary
+        if end < text_len:
+            search_start = max(end - 500, start)
+            last_period = text.rfind(". ", search_start, end)
+            if last_period > search_start:
+                end = last_period + 1
+
+        yield start, end
+        start = end
 
 
 class TranscriptStore:
@@ -25,6 +74,7 @@ class TranscriptStore:
     .cache/transcripts/
         {video_id}.json  # Full transcript + metadata
         {video_id}.summary.json  # Processed summary
+        _pending.json  # Video IDs awaiting summarization
     """
 
     def __init__(self):
@@ -36,14 +86,14 @@ class TranscriptStore:
     def _summary_path(self, video_id: str) -> Path:
         return CACHE_DIR / f"{video_id}.summary.json"
 
-    def get_transcript(self, video_id: str) -> dict | None:
+    async def get_transcript(self, video_id: str) -> dict | None:
         """Get stored transcript for a video."""
         path = self._transcript_path(video_id)
         if path.exists():
-            return json.loads(path.read_text())
+            return await asyncio.to_thread(_read_json, path)
         return None
 
-    def save_transcript(
+    async def save_transcript(
         self,
         video_id: str,
         transcript: str,
@@ -62,17 +112,19 @@ class TranscriptStore:
             "duration_seconds": duration_seconds,
             "fetched_at": datetime.now(timezone.utc).isoformat(),
         }
-        self._transcript_path(video_id).write_text(json.dumps(data, indent=2))
+        await asyncio.to_thread(_write_json, self._transcript_path(video_id), data)
+        if not self.has_summary(video_id):
+            await asyncio.to_thread(self._update_pending, add=video_id)
         logger.info(f"Saved transcript for {video_id}: {len(transcript)} chars")
 
-    def get_summary(self, video_id: str) -> dict | None:
+    async def get_summary(self, video_id: str) -> dict | None:
         """Get processed summary for a video."""
         path = self._summary_path(video_id)
         if path.exists():
-            return json.loads(path.read_text())
+            return await asyncio.to_thread(_read_json, path)
         return None
 
-    def save_summary(
+    async def save_summary(
         self,
         video_id: str,
         summary: str,
@@ -89,7 +141,8 @@ class TranscriptStore:
             "model_used": model_used,
             "processed_at": datetime.now(timezone.utc).isoformat(),
         }
-        self._summary_path(video_id).write_text(json.dumps(data, indent=2))
+        await asyncio.to_thread(_write_json, self._summary_path(video_id), data)
+        await asyncio.to_thread(self._update_pending, remove=video_id)
         logger.info(f"Saved summary for {video_id}")
 
     def has_summary(self, video_id: str) -> bool:
@@ -98,15 +151,54 @@ class TranscriptStore:
 
     def list_pending(self) -> list[str]:
         """List video IDs that have transcripts but no summaries."""
+        with _pending_lock:
+            return self._read_pending()
+
+    async def discard_pending(self, video_id: str) -> None:
+        """Drop a video ID from the pending index (e.g. its transcript is gone)."""
+        await asyncio.to_thread(self._update_pending, remove=video_id)
+
+    def rebuild_index(self) -> list[str]:
+        """
+        Rebuild the pending index by scanning the cache directory.
+
+        Fallback for a missing or corrupt index (e.g. after a crash).
+        """
+        with _pending_lock:
+            return self._rebuild_pending()
+
+    def _rebuild_pending(self) -> list[str]:
+        """Rebuild the pending index; the caller must hold _pending_lock."""
         pending = []
         for path in CACHE_DIR.glob("*.json"):
-            if path.name.endswith(".summary.json"):
+            if path.name.endswith(".summary.json") or path == PENDING_INDEX_FILE:
                 continue
             video_id = path.stem
             if not self.has_summary(video_id):
                 pending.append(video_id)
+        _write_json(PENDING_INDEX_FILE, pending)
+        logger.info(f"Rebuilt pending transcript index: {len(pending)} pending")
         return pending
 
+    def _read_pending(self) -> list[str]:
+        """Read the pending index, rebuilding it if unavailable."""
+        if PENDING_INDEX_FILE.exists():
+            try:
+                return _read_json(PENDING_INDEX_FILE)
+            except (json.JSONDecodeError, IOError) as e:
+                logger.warning(f"Failed to load pending index: {e}")
+        return self._rebuild_pending()
+
+    def _update_pending(self, add: str | None = None, remove: str | None = None) -> None:
+        """Add and/or remove a video ID in the pending index."""
+        with _pending_lock:
+            pending = self._read_pending()
+            if add is not None and add not in pending:
+                pending.append(add)
+            if remove is not None and remove in pending:
+                pending.remove(remove)
+            _write_json(PENDING_INDEX_FILE, pending)
+
 
 class TranscriptProcessor:
     """
@@ -124,6 +216,58 @@ class TranscriptProcessor:
         )
         self._model = settings.xai_model_cheap
         self._store = TranscriptStore()
+        CHUNK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+
+    async def _cached_completion(self, prompt: str, **kw: Any) -> str:
+        """
+        Run a single-prompt chat completion, cached on disk by exact input.
+
+        The key covers everything that affects the output (model, prompt,
+        temperature, max_tokens, response_format), so re-running a video
+        reuses previous responses instead of paying for the same call again.
+        """
+        key = hashlib.sha256(
+            json.dumps(
+                {
+                    "m": self._model,
+                    "p": prompt,
+                    "t": kw.get("temperature"),
+                    "mt": kw.get("max_tokens"),
+                    "rf": kw.get("response_format"),
+                },
+                sort_keys=True,
+            ).encode()
+        ).hexdigest()
+        path = CHUNK_CACHE_DIR / f"{key}.txt"
+
+        if path.exists():
+            logger.debug(f"LLM cache hit: {key[:12]}")
+            return await asyncio.to_thread(path.read_text)
+
+        response = await self._client.chat.completions.create(
+            model=self._model,
+            messages=[{"role": "user", "content": prompt}],
+            **kw,
+        )
+        choice = response.choices[0]
+        content = choice.message.content or ""
+
+        # Only cache complete answers; an empty or length-truncated reply
+        # would otherwise be served forever and never retried
+        if not content or choice.finish_reason != "stop":
+            logger.warning(
+                f"Not caching LLM response {key[:12]} "
+                f"(finish_reason={choice.finish_reason}, {len(content)} chars)"
+            )
+            return content
+
+        # Write atomically so a crash never leaves a truncated cache entry. The
+        # tmp name is unique per write: concurrent coroutines in this process
+        # may be filling the same key.
+        tmp_path = path.with_suffix(f".{uuid.uuid4().hex}.tmp")
+        await asyncio.to_thread(tmp_path.write_text, content)
+        os.replace(tmp_path, path)
+        return content
 
     async def summarize_transcript(
         self,
@@ -138,7 +282,7 @@ class TranscriptProcessor:
         For very long transcripts, we chunk and summarize iteratively.
         """
         # Check if already summarized
-        existing = self._store.get_summary(video_id)
+        existing = await self._store.get_summary(video_id)
         if existing:
             logger.debug(f"Using cached summary for {video_id}")
             return existing
@@ -158,7 +302,7 @@ class TranscriptProcessor:
             )
 
         # Save the summary
-        self._store.save_summary(
+        await self._store.save_summary(
             video_id=video_id,
             summary=summary["summary"],
             key_points=summary["key_points"],
@@ -192,19 +336,18 @@ Respond in JSON format:
   "topics": ["topic 1", "topic 2", ...]
 }}"""
 
-        response = await self._client.chat.completions.create(
-            model=self._model,
-            messages=[{"role": "user", "content": prompt}],
+        content = await self._cached_completion(
+            prompt,
             response_format={"type": "json_object"},
             temperature=0.3,
         )
 
         try:
-            return json.loads(response.choices[0].message.content)
+            return json.loads(content)
         except json.JSONDecodeError:
             # Fallback if JSON parsing fails
             return {
-                "summary": response.choices[0].message.content,
+                "summary": content,
                 "key_points": [],
                 "topics": [],
             }
@@ -222,31 +365,20 @@ Respond in JSON format:
         Strategy:
         1. Split into chunks
         2. Summarize each chunk
-        3. Combine chunk summaries into final summary
+        3. Combine chunk summaries into final summary (for many chunks,
+           merge them in groups first so the final prompt stays bounded)
         """
-        # Split into chunks (try to break at sentence boundaries)
-        chunks = []
-        current_pos = 0
-        while current_pos < len(transcript):
-            end_pos = min(current_pos + chunk_size, len(transcript))
-
-            # Try to break at a sentence boundary
-            if end_pos < len(transcript):
-                # Look for period, question mark, or exclamation in last 500 chars
-                search_start = max(end_pos - 500, current_pos)
-                last_period = transcript.rfind('. ', search_start, end_pos)
-                if last_period > search_start:
-                    end_pos = last_period + 1
+        # Split into chunks (try to break at sentence boundaries). Only the
+        # (start, end) offsets are kept; each slice is taken when its prompt is built.
+        bounds = list(_iter_chunk_bounds(transcript, chunk_size))
 
-            chunks.append(transcript[current_pos:end_pos])
-            current_pos = end_pos
-
-        logger.info(f"Split transcript into {len(chunks)} chunks")
+        logger.info(f"Split transcript into {len(bounds)} chunks")
 
         # Summarize each chunk
         chunk_summaries = []
-        for i, chunk in enumerate(chunks):
-            prompt = f"""Summarize this section ({i+1}/{len(chunks)}) of a video transcript.
+        for i, (start, end) in enumerate(bounds):
+            chunk = transcript[start:end]
+            prompt = f"""Summarize this section ({i+1}/{len(bounds)}) of a video transcript.
 Focus on key information, arguments, and insights.
 
 Video: "{video_title}" by {channel_name}
@@ -256,13 +388,21 @@ Section:
 
 Provide a concise summary (1-2 paragraphs) of this section:"""
 
-            response = await self._client.chat.completions.create(
-                model=self._model,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-                max_tokens=500,
+            chunk_summaries.append(
+                await self._cached_completion(prompt, temperature=0.3, max_tokens=500)
+            )
+
+        # Few chunks: the section summaries are short enough to go straight
+        # through the single-context JSON path instead of a separate reduce prompt
+        if len(chunk_summaries) <= SHORT_REDUCE_MAX_CHUNKS:
+            combined = "\n\n".join(chunk_summaries)
+            return await self._summarize_short_transcript(combined, video_title, channel_name)
+
+        # Many chunks: reduce hierarchically so the final prompt stays bounded
+        while len(chunk_summaries) > TREE_REDUCE_MIN_CHUNKS:
+            chunk_summaries = await self._reduce_summary_groups(
+                chunk_summaries, video_title, channel_name
             )
-            chunk_summaries.append(response.choices[0].message.content)
 
         # Combine chunk summaries into final summary
         combined = "\n\n".join(f"[Part {i+1}]: {s}" for i, s in enumerate(chunk_summaries))
@@ -284,48 +424,84 @@ Respond in JSON format:
   "topics": ["topic 1", "topic 2", ...]
 }}"""
 
-        response = await self._client.chat.completions.create(
-            model=self._model,
-            messages=[{"role": "user", "content": final_prompt}],
+        content = await self._cached_completion(
+            final_prompt,
             response_format={"type": "json_object"},
             temperature=0.3,
         )
 
         try:
-            return json.loads(response.choices[0].message.content)
+            return json.loads(content)
         except json.JSONDecodeError:
             return {
-                "summary": response.choices[0].message.content,
+                "summary": content,
                 "key_points": [],
                 "topics": [],
             }
 
-    async def process_pending(self, limit: int = 10) -> int:
+    async def _reduce_summary_groups(
+        self,
+        summaries: list[str],
+        video_title: str,
+        channel_name: str,
+    ) -> list[str]:
+        """Merge consecutive section summaries in groups of TREE_REDUCE_GROUP_SIZE."""
+        merged = []
+        for i in range(0, len(summaries), TREE_REDUCE_GROUP_SIZE):
+            group = summaries[i:i + TREE_REDUCE_GROUP_SIZE]
+            if len(group) == 1:
+                merged.append(group[0])
+                continue
+
+            sections = "\n\n".join(group)
+            prompt = f"""Combine these consecutive section summaries of a video transcript
+into one concise summary (1-2 paragraphs). Keep key information, arguments, and insights.
+
+Video: "{video_title}" by {channel_name}
+
+Section summaries:
+{sections}
+
+Combined summary:"""
+
+            merged.append(
+                await self._cached_completion(prompt, temperature=0.3, max_tokens=500)
+            )
+        return merged
+
+    async def process_pending(self, limit: int = 10, concurrency: int = 4) -> int:
         """
         Process pending transcripts that don't have summaries yet.
 
+        Videos are summarized concurrently, at most `concurrency` at a time.
+
         Returns number of transcripts processed.
         """
         pending = self._store.list_pending()[:limit]
-        processed = 0
-
-        for video_id in pending:
-            transcript_data = self._store.get_transcript(video_id)
-            if not transcript_data:
-                continue
-
-            try:
-                await self.summarize_transcript(
-                    video_id=video_id,
-                    transcript=transcript_data["transcript"],
-                    video_title=transcript_data.get("video_title", "Unknown"),
-                    channel_name=transcript_data.get("channel_name", "Unknown"),
-                )
-                processed += 1
-            except Exception as e:
-                logger.error(f"Error processing {video_id}: {e}")
-
-        return processed
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def process_one(video_id: str) -> bool:
+            async with semaphore:
+                transcript_data = await self._store.get_transcript(video_id)
+                if not transcript_data:
+                    # Transcript file is gone; stop it taking a slot every run
+                    await self._store.discard_pending(video_id)
+                    return False
+
+                try:
+                    await self.summarize_transcript(
+                        video_id=video_id,
+                        transcript=transcript_data["transcript"],
+                        video_title=transcript_data.get("video_title", "Unknown"),
+                        channel_name=transcript_data.get("channel_name", "Unknown"),
+                    )
+                    return True
+                except Exception as e:
+                    logger.error(f"Error processing {video_id}: {e}")
+                    return False
+
+        results = await asyncio.gather(*(process_one(v) for v in pending))
+        return sum(results)
 
 
 # Singleton instances
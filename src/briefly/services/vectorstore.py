@@ -3,6 +3,7 @@
 import json
 import logging
 import uuid
+from collections import OrderedDict
 from datetime import datetime
 
 from sqlalchemy import text
@@ -12,6 +13,20 @@ from briefly.services.embeddings import EmbeddingService
 
 logger = logging.getLogger(__name__)
 
+# LRU of query embeddings, keyed by (model, query). Embeddings are deterministic,
+# so repeated searches can skip the embedding API call. Module-level because
+# routes construct a new VectorStore per request.
+QUERY_CACHE_SIZE = 512
+_query_embedding_cache: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
+
+# HNSW search breadth (see migrations/002_hnsw_index.sql); higher = better recall.
+# An index scan returns at most ef_search candidates, so it is never set below
+# the requested limit. Filters are applied to those candidates after the scan,
+# so filtered searches widen it to leave enough rows once filtered.
+HNSW_EF_SEARCH = 40
+HNSW_FILTERED_EF_SEARCH = 400
+HNSW_MAX_EF_SEARCH = 1000  # pgvector's upper bound for hnsw.ef_search
+
 
 class VectorStore:
     """Store and search content with vector embeddings."""
@@ -19,6 +34,20 @@ class VectorStore:
     def __init__(self) -> None:
         self._embeddings = EmbeddingService()
 
+    async def _embed_query(self, query: str) -> list[float]:
+        """Get the embedding for a search query, using the in-process LRU."""
+        key = (self._embeddings.model, query)
+        cached = _query_embedding_cache.get(key)
+        if cached is not None:
+            _query_embedding_cache.move_to_end(key)
+            return cached
+
+        embedding = await self._embeddings.generate_embedding(query)
+        _query_embedding_cache[key] = embedding
+        if len(_query_embedding_cache) > QUERY_CACHE_SIZE:
+            _query_embedding_cache.popitem(last=False)
+        return embedding
+
     async def store_content(
         self,
         platform: str,
@@ -41,24 +70,10 @@ class VectorStore:
             return None
 
         async with get_async_session() as session:
-            # Check if content already exists
-            check_sql = text("""
-                SELECT id FROM content_items
-                WHERE platform = :platform AND platform_id = :platform_id
-            """)
-            result = await session.execute(
-                check_sql,
-                {"platform": platform, "platform_id": platform_id},
-            )
-            existing = result.fetchone()
-
-            if existing:
-                logger.debug(f"Content already exists: {platform}/{platform_id}")
-                return existing[0]
-
-            # 1. Insert content item
-            content_id = uuid.uuid4()
-            insert_content_sql = text("""
+            # 1. Insert content item. A no-op update on conflict lets RETURNING
+            # hand back the existing id in the same round trip; xmax = 0 is only
+            # true for freshly inserted rows.
+            upsert_content_sql = text("""
                 INSERT INTO content_items (
                     id, platform, platform_id, source_id, source_name,
                     title, content, url, metrics, published_at
@@ -67,12 +82,15 @@ class VectorStore:
                     :id, :platform, :platform_id, :source_id, :source_name,
                     :title, :content, :url, :metrics, :published_at
                 )
+                ON CONFLICT (platform, platform_id)
+                DO UPDATE SET platform = EXCLUDED.platform
+                RETURNING id, (xmax = 0) AS inserted
             """)
 
-            await session.execute(
-                insert_content_sql,
+            result = await session.execute(
+                upsert_content_sql,
                 {
-                    "id": content_id,
+                    "id": uuid.uuid4(),
                     "platform": platform,
                     "platform_id": platform_id,
                     "source_id": source_id,
@@ -84,6 +102,12 @@ class VectorStore:
                     "published_at": published_at,
                 },
             )
+            row = result.fetchone()
+            content_id = row.id
+
+            if not row.inserted:
+                logger.debug(f"Content already exists: {platform}/{platform_id}")
+                return content_id
 
             # 2. Chunk the content
             chunks = self._embeddings.chunk_text(content)
@@ -119,7 +143,7 @@ class VectorStore:
                         "chunk_index": i,
                         "content": chunk,
                         "token_count": self._embeddings.count_tokens(chunk),
-                        "embedding": str(embedding),
+                        "embedding": embedding,
                     },
                 )
 
@@ -143,35 +167,50 @@ class VectorStore:
         Returns list of matching content with similarity scores.
         """
         # 1. Generate embedding for query
-        query_embedding = await self._embeddings.generate_embedding(query)
+        query_embedding = await self._embed_query(query)
 
         async with get_async_session() as session:
-            # 2. Build query dynamically to avoid NULL type inference issues
-            where_clauses = ["cc.embedding IS NOT NULL"]
+            # 2. Build item filters dynamically to avoid NULL type inference issues
+            filter_clauses: list[str] = []
             params: dict = {
-                "embedding": str(query_embedding),
+                "embedding": query_embedding,
                 "limit": limit,
             }
 
             if platform is not None:
-                where_clauses.append("ci.platform = :platform")
+                filter_clauses.append("platform = :platform")
                 params["platform"] = platform
 
             if source_id is not None:
-                where_clauses.append("ci.source_id = :source_id")
+                filter_clauses.append("source_id = :source_id")
                 params["source_id"] = source_id
 
             if since is not None:
-                where_clauses.append("ci.published_at >= :since")
+                filter_clauses.append("published_at >= :since")
                 params["since"] = since
 
             if until is not None:
-                where_clauses.append("ci.published_at <= :until")
+                filter_clauses.append("published_at <= :until")
                 params["until"] = until
 
+            # Keep the item filters in a CTE so the ORDER BY stays on
+            # content_chunks alone and the planner can use the HNSW index.
+            # The CTE is inlined, so the filter runs on the index scan's
+            # candidates rather than before it (see ef_search below).
+            where_clauses = ["cc.embedding IS NOT NULL"]
+            eligible_sql = ""
+            if filter_clauses:
+                eligible_sql = (
+                    "WITH eligible AS (SELECT id FROM content_items WHERE "
+                    + " AND ".join(filter_clauses)
+                    + ")"
+                )
+                where_clauses.append("cc.content_id IN (SELECT id FROM eligible)")
+
             where_sql = " AND ".join(where_clauses)
 
             sql = text(f"""
+                {eligible_sql}
                 SELECT
                     ci.id,
                     ci.platform,
@@ -182,14 +221,22 @@ class VectorStore:
                     ci.url,
                     ci.published_at,
                     cc.content as chunk_content,
-                    1 - (cc.embedding <=> CAST(:embedding AS vector)) as similarity
+                    1 - (cc.embedding <=> :embedding) as similarity
                 FROM content_chunks cc
                 JOIN content_items ci ON cc.content_id = ci.id
                 WHERE {where_sql}
-                ORDER BY cc.embedding <=> CAST(:embedding AS vector)
+                ORDER BY cc.embedding <=> :embedding
                 LIMIT :limit
             """)
 
+            # 3. Size the HNSW candidate list for this transaction only
+            if filter_clauses:
+                ef_search = max(HNSW_FILTERED_EF_SEARCH, limit * 20)
+            else:
+                ef_search = max(HNSW_EF_SEARCH, limit)
+            ef_search = min(ef_search, HNSW_MAX_EF_SEARCH)
+            await session.execute(text(f"SET LOCAL hnsw.ef_search = {ef_search}"))
+
             result = await session.execute(sql, params)
 
             rows = result.fetchall()
@@ -5,12 +5,17 @@ dramatically reducing API usage compared to individual timeline fetching.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
-from datetime import datetime, timedelta
+import os
+import time
+from collections.abc import Awaitable, Callable
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+import aiohttp
 import tweepy
 from tweepy.asynchronous import AsyncClient
 
@@ -24,53 +29,102 @@ logger = logging.getLogger(__name__)
 STATE_DIR = Path(__file__).parent.parent.parent.parent / ".cache"
 LIST_STATE_FILE = STATE_DIR / "x_list_state.json"
 
+# Characters never valid in an X username; stripped in one pass
+_USERNAME_STRIP = str.maketrans("", "", "@ ")
+
+
+def _normalize_username(username: str) -> str:
+    """Canonical username key: lowercase, without "@" or spaces."""
+    return username.translate(_USERNAME_STRIP).lower()
+
 
 def _load_list_state() -> dict:
     """Load list state from file."""
     if LIST_STATE_FILE.exists():
         try:
-            return json.loads(LIST_STATE_FILE.read_text())
+            return json.loads(LIST_STATE_FILE.read_bytes())
         except (json.JSONDecodeError, IOError) as e:
             logger.warning(f"Failed to load list state: {e}")
     return {}
 
 
-def _save_list_state(state: dict) -> None:
-    """Save list state to file."""
+def _save_list_state(state: dict) -> bool:
+    """Save list state to file (atomically, so a crash can't leave it torn)."""
     STATE_DIR.mkdir(exist_ok=True)
+    tmp_file = LIST_STATE_FILE.with_suffix(".tmp")
     try:
-        LIST_STATE_FILE.write_text(json.dumps(state, indent=2))
+        tmp_file.write_bytes(json.dumps(state, separators=(",", ":")).encode())
+        os.replace(tmp_file, LIST_STATE_FILE)
+        return True
     except IOError as e:
         logger.warning(f"Failed to save list state: {e}")
+        return False
 
 
 class RateLimitTracker:
-    """Track rate limit usage for list member operations."""
+    """
+    Track rate limit usage for list member operations.
+
+    Uses a sliding-window counter: counts for the current and previous fixed
+    windows, with the previous one weighted by how much of it still overlaps
+    the sliding window. Constant memory regardless of operation volume.
+    """
 
     def __init__(self, window_minutes: int = 15, max_operations: int = 300):
         self.window_minutes = window_minutes
         self.max_operations = max_operations
-        self._operations: list[datetime] = []
-
-    def _clean_old_operations(self) -> None:
-        """Remove operations outside the current window."""
-        cutoff = datetime.now() - timedelta(minutes=self.window_minutes)
-        self._operations = [t for t in self._operations if t > cutoff]
+        self._window_seconds = window_minutes * 60
+        self._prev_count = 0
+        self._cur_count = 0
+        self._cur_window = 0  # Index of the current fixed window (epoch-aligned)
+
+    def _estimate(self) -> float:
+        """Roll windows forward and return the estimated usage in the sliding window."""
+        now = time.time()
+        window = int(now // self._window_seconds)
+        if window != self._cur_window:
+            self._prev_count = self._cur_count if window == self._cur_window + 1 else 0
+            self._cur_count = 0
+            self._cur_window = window
+
+        elapsed = (now - window * self._window_seconds) / self._window_seconds
+        return self._prev_count * (1 - elapsed) + self._cur_count
 
     def can_operate(self, count: int = 1) -> bool:
         """Check if we can perform count operations."""
-        self._clean_old_operations()
-        return len(self._operations) + count <= self.max_operations
+        return self._estimate() + count <= self.max_operations
 
     def record_operation(self, count: int = 1) -> None:
         """Record that operations were performed."""
-        now = datetime.now()
-        self._operations.extend([now] * count)
+        self._estimate()
+        self._cur_count += count
 
     def available_operations(self) -> int:
         """Return number of operations available in current window."""
-        self._clean_old_operations()
-        return self.max_operations - len(self._operations)
+        return int(self.max_operations - self._estimate())
+
+    def to_dict(self) -> dict[str, int]:
+        """Serialize counter state for persistence."""
+        return {
+            "prev": self._prev_count,
+            "cur": self._cur_count,
+            "window": self._cur_window,
+        }
+
+    @classmethod
+    def from_dict(
+        cls,
+        data: dict[str, int] | None,
+        window_minutes: int = 15,
+        max_operations: int = 300,
+    ) -> "RateLimitTracker":
+        """Restore a tracker from to_dict() output (stale windows roll off naturally)."""
+        tracker = cls(window_minutes=window_minutes, max_operations=max_operations)
+        if data:
+            tracker._prev_count = data.get("prev", 0)
+            tracker._cur_count = data.get("cur", 0)
+            tracker._cur_window = data.get("window", 0)
+        return tracker
 
 
 class XListManager:
@@ -84,11 +138,24 @@ class XListManager:
     # Default list name - can be overridden per user
     DEFAULT_LIST_NAME = "briefly_sources"
 
+    # Max concurrent add/remove member calls during sync
+    MEMBER_OP_CONCURRENCY = 16
+
+    # How long a successful list-existence check is trusted (seconds)
+    LIST_VERIFY_TTL = 300.0
+
+    # How long an unchanged source set is trusted to still match the list (seconds)
+    SYNC_SKIP_TTL = 3600.0
+
+    # X caps lists at 5000 members; page through all of them
+    MAX_LIST_MEMBERS = 5000
+
     def __init__(self, list_name: str | None = None) -> None:
         settings = get_settings()
 
-        # OAuth 1.0a client for list management (write operations)
-        self._bot_client = tweepy.Client(
+        # OAuth 1.0a async client for list management. The list is private, so
+        # reads on it also go through user auth (user_auth=True).
+        self._bot_client = AsyncClient(
             consumer_key=settings.x_api_key,
             consumer_secret=settings.x_api_key_secret,
             access_token=settings.x_access_token,
@@ -102,14 +169,29 @@ class XListManager:
             wait_on_rate_limit=False,
         )
 
-        # Rate limit tracking
-        self._add_rate_tracker = RateLimitTracker(window_minutes=15, max_operations=300)
-        self._remove_rate_tracker = RateLimitTracker(window_minutes=15, max_operations=300)
-
         # Load persisted state
         self._state = _load_list_state()
-        self._list_id: str | None = self._state.get("list_id")
+
+        # Rate limit tracking, restored so a restart can't burst past the X limits
+        self._add_rate_tracker = RateLimitTracker.from_dict(
+            self._state.get("add_rate"), window_minutes=15, max_operations=300
+        )
+        self._remove_rate_tracker = RateLimitTracker.from_dict(
+            self._state.get("remove_rate"), window_minutes=15, max_operations=300
+        )
         self._list_name: str = list_name or self._state.get("list_name") or self.DEFAULT_LIST_NAME
+        # The persisted list ID belongs to the persisted list name only
+        self._list_id: str | None = (
+            self._state.get("list_id")
+            if self._state.get("list_name", self._list_name) == self._list_name
+            else None
+        )
+        self._list_verified_at = 0.0  # time.monotonic() of last successful check
+        self._state_digest: bytes | None = None  # digest of the last state written
+
+        # Shared HTTP session for both clients (created on first use, inside
+        # the event loop). Without it tweepy opens a new session per request.
+        self._session: aiohttp.ClientSession | None = None
 
     @property
     def list_name(self) -> str:
@@ -132,24 +214,58 @@ class XListManager:
         """Persist current state."""
         self._state["list_id"] = self._list_id
         self._state["list_name"] = self._list_name
+        self._state["add_rate"] = self._add_rate_tracker.to_dict()
+        self._state["remove_rate"] = self._remove_rate_tracker.to_dict()
+
+        # Skip the write if nothing but the timestamp would change
+        content = {k: v for k, v in self._state.items() if k != "last_updated"}
+        digest = hashlib.blake2b(
+            json.dumps(content, sort_keys=True, separators=(",", ":")).encode(),
+            digest_size=16,
+        ).digest()
+        if digest == self._state_digest:
+            return
+
         self._state["last_updated"] = datetime.now().isoformat()
-        _save_list_state(self._state)
+        if _save_list_state(self._state):
+            self._state_digest = digest
+
+    def _ensure_session(self) -> None:
+        """Attach a keep-alive HTTP session to both clients if not already open."""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.MEMBER_OP_CONCURRENCY * 2),
+            )
+            self._bot_client.session = self._session
+            self._async_client.session = self._session
+
+    async def aclose(self) -> None:
+        """Persist state (including rate-limit counters) and close the session."""
+        self._save_state()
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._bot_client.session = None
+            self._async_client.session = None
 
     async def get_list_id(self) -> str | None:
         """Get the list ID, checking if it still exists."""
+        self._ensure_session()
         if self._list_id:
+            # Skip the API round trip if we verified the list recently
+            if time.monotonic() - self._list_verified_at < self.LIST_VERIFY_TTL:
+                return self._list_id
+
             # Verify list still exists
             try:
-                loop = asyncio.get_event_loop()
-                response = await loop.run_in_executor(
-                    None,
-                    lambda: self._bot_client.get_list(id=self._list_id)
-                )
+                response = await self._bot_client.get_list(self._list_id, user_auth=True)
                 if response.data:
+                    self._list_verified_at = time.monotonic()
                     return self._list_id
             except tweepy.errors.NotFound:
                 logger.warning(f"List {self._list_id} no longer exists")
                 self._list_id = None
+                self._list_verified_at = 0.0
                 self._save_state()
             except tweepy.errors.TweepyException as e:
                 logger.warning(f"Error checking list: {e}")
@@ -162,14 +278,9 @@ class XListManager:
         if await self.get_list_id():
             return self._list_id
 
-        loop = asyncio.get_event_loop()
-
         # Get authenticated user ID first
         try:
-            me_response = await loop.run_in_executor(
-                None,
-                lambda: self._bot_client.get_me()
-            )
+            me_response = await self._bot_client.get_me()
             my_user_id = me_response.data.id
         except tweepy.errors.TweepyException as e:
             logger.error(f"Failed to get authenticated user: {e}")
@@ -177,15 +288,15 @@ class XListManager:
 
         # Look for existing list by name
         try:
-            response = await loop.run_in_executor(
-                None,
-                lambda: self._bot_client.get_owned_lists(id=my_user_id, max_results=100)
+            response = await self._bot_client.get_owned_lists(
+                my_user_id, max_results=100, user_auth=True
             )
 
             if response.data:
                 for lst in response.data:
                     if lst.name == self._list_name:
                         self._list_id = str(lst.id)
+                        self._list_verified_at = time.monotonic()
                         self._state["list_verified"] = True
                         logger.info(f"Found existing list '{self._list_name}': {self._list_id}")
                         self._save_state()
@@ -196,15 +307,13 @@ class XListManager:
         # Create new private list
         try:
             list_desc = f"Briefly 3000 curated sources - {self._list_name}"
-            response = await loop.run_in_executor(
-                None,
-                lambda: self._bot_client.create_list(
-                    name=self._list_name,
-                    description=list_desc,
-                    private=True,
-                )
+            response = await self._bot_client.create_list(
+                name=self._list_name,
+                description=list_desc,
+                private=True,
             )
             self._list_id = str(response.data["id"])
+            self._list_verified_at = time.monotonic()
             self._state["list_verified"] = True
             self._state["created_at"] = datetime.now().isoformat()
             logger.info(f"Created new list '{self._list_name}': {self._list_id}")
@@ -219,25 +328,30 @@ class XListManager:
         if not self._list_id:
             return []
 
+        self._ensure_session()
         members = []
+        pagination_token = None
         try:
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self._bot_client.get_list_members(
-                    id=self._list_id,
+            while len(members) < self.MAX_LIST_MEMBERS:
+                response = await self._bot_client.get_list_members(
+                    self._list_id,
                     max_results=100,
+                    pagination_token=pagination_token,
                     user_fields=["id", "username", "name"],
+                    user_auth=True,
                 )
-            )
 
-            if response.data:
-                for user in response.data:
-                    members.append({
-                        "id": str(user.id),
-                        "username": user.username,
-                        "name": user.name,
-                    })
+                if response.data:
+                    for user in response.data:
+                        members.append({
+                            "id": str(user.id),
+                            "username": user.username,
+                            "name": user.name,
+                        })
+
+                pagination_token = (response.meta or {}).get("next_token")
+                if not pagination_token:
+                    break
         except tweepy.errors.TweepyException as e:
             logger.error(f"Error fetching list members: {e}")
 
@@ -251,20 +365,17 @@ class XListManager:
         """
         if not self._list_id:
             await self.ensure_list_exists()
+        return await self._add_member(self._list_id, user_id)
 
+    async def _add_member(self, list_id: str, user_id: str) -> bool:
+        """Add a user to a list the caller has already ensured exists."""
+        self._ensure_session()
         if not self._add_rate_tracker.can_operate():
             logger.warning("Rate limit reached for list member additions")
             return False
 
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: self._bot_client.add_list_member(
-                    id=self._list_id,
-                    user_id=user_id,
-                )
-            )
+            await self._bot_client.add_list_member(list_id, user_id)
             self._add_rate_tracker.record_operation()
             logger.debug(f"Added user {user_id} to list")
             return True
@@ -283,20 +394,17 @@ class XListManager:
         """
         if not self._list_id:
             return False
+        return await self._remove_member(self._list_id, user_id)
 
+    async def _remove_member(self, list_id: str, user_id: str) -> bool:
+        """Remove a user from a list the caller has already ensured exists."""
+        self._ensure_session()
         if not self._remove_rate_tracker.can_operate():
             logger.warning("Rate limit reached for list member removals")
             return False
 
         try:
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None,
-                lambda: self._bot_client.remove_list_member(
-                    id=self._list_id,
-                    user_id=user_id,
-                )
-            )
+            await self._bot_client.remove_list_member(list_id, user_id)
             self._remove_rate_tracker.record_operation()
             logger.debug(f"Removed user {user_id} from list")
             return True
@@ -307,48 +415,91 @@ class XListManager:
             logger.warning(f"Failed to remove user {user_id}: {e}")
             return False
 
-    async def sync_sources(self, source_usernames: list[str]) -> dict[str, Any]:
+    async def sync_sources(
+        self, source_usernames: list[str], force: bool = False
+    ) -> dict[str, Any]:
         """
         Sync local sources with list membership.
 
-        Adds missing members and removes stale ones.
+        Adds missing members and removes stale ones. Unless `force` is set,
+        the sync is skipped when the same sources synced cleanly to the same
+        list within SYNC_SKIP_TTL.
 
         Returns sync result with added/removed/failed counts.
         """
-        await self.ensure_list_exists()
+        # Normalize each username once (deduplicated, order preserved)
+        keys = list(dict.fromkeys(map(_normalize_username, source_usernames)))
+
+        list_id = await self.ensure_list_exists()
+
+        # Skip the lookups and member calls if this exact source set synced
+        # cleanly to this list recently. The list ID is part of the hash, so a
+        # recreated or switched list is always synced.
+        sync_hash = hashlib.blake2b(
+            "\n".join([list_id, *sorted(keys)]).encode(), digest_size=16
+        ).hexdigest()
+        last_sync = self._state.get("last_sync")
+        if (
+            not force
+            and self._state.get("last_sync_hash") == sync_hash
+            and last_sync
+            and (datetime.now() - datetime.fromisoformat(last_sync)).total_seconds()
+            < self.SYNC_SKIP_TTL
+        ):
+            logger.info("Sources unchanged since last sync; skipping list sync")
+            return {
+                "added": [],
+                "removed": [],
+                "failed": [],
+                "failed_removals": [],
+                "already_synced": self._state.get("synced_usernames", []),
+            }
 
         # Get user IDs for source usernames
         cache = get_user_cache()
         target_users: dict[str, str] = {}  # username -> user_id
 
         # Check cache first
-        for username in source_usernames:
-            key = username.lower().lstrip("@")
+        for key in keys:
             cached = cache.get(key)
             if cached and cached.get("id"):
                 target_users[key] = str(cached["id"])
 
-        # Fetch uncached users
-        uncached = [u for u in source_usernames if u.lower().lstrip("@") not in target_users]
+        # Fetch uncached users (X usernames are case-insensitive)
+        lookup_failed = False
+        uncached = [key for key in keys if key not in target_users]
         if uncached:
-            try:
-                for i in range(0, len(uncached), 100):
-                    batch = [u.lstrip("@") for u in uncached[i:i + 100]]
-                    response = await self._async_client.get_users(
+            # Look up all 100-username batches concurrently (read path, bearer token)
+            batches = [uncached[i:i + 100] for i in range(0, len(uncached), 100)]
+            responses = await asyncio.gather(
+                *(
+                    self._async_client.get_users(
                         usernames=batch,
                         user_fields=["id", "name", "username"],
                     )
-                    if response.data:
-                        for user in response.data:
-                            key = user.username.lower()
-                            target_users[key] = str(user.id)
-                            cache.set(key, {
-                                "id": str(user.id),
-                                "username": user.username,
-                                "name": user.name,
-                            })
-            except tweepy.errors.TweepyException as e:
-                logger.error(f"Error fetching users: {e}")
+                    for batch in batches
+                ),
+                return_exceptions=True,
+            )
+            new_users = {}
+            for response in responses:
+                if isinstance(response, Exception):
+                    logger.error(f"Error fetching users: {response}")
+                    lookup_failed = True
+                    continue
+                if response.data:
+                    for user in response.data:
+                        key = user.username.lower()
+                        target_users[key] = str(user.id)
+                        new_users[key] = {
+                            "id": str(user.id),
+                            "username": user.username,
+                            "name": user.name,
+                        }
+
+            # One cache write for all lookups instead of one per user
+            if new_users:
+                cache.set_many(new_users)
 
         # Get current list members
         current_members = await self.get_list_members()
@@ -365,34 +516,61 @@ class XListManager:
             "added": [],
             "removed": [],
             "failed": [],
+            "failed_removals": [],  # stale members still on the list
             "already_synced": list(target_usernames & current_usernames),
         }
 
-        # Add new members
-        for username in to_add:
-            user_id = target_users.get(username)
-            if user_id:
-                if await self.add_member(user_id):
-                    result["added"].append(username)
-                else:
-                    result["failed"].append(username)
-
-        # Remove stale members
-        for username in to_remove:
-            user_id = current_by_username.get(username)
-            if user_id:
-                if await self.remove_member(user_id):
-                    result["removed"].append(username)
+        # Add and remove members concurrently. Only as many calls as the rate
+        # windows allow are scheduled, so parallel calls can't overshoot them.
+        adds = sorted(to_add)
+        removes = sorted(to_remove)
+        add_budget = max(self._add_rate_tracker.available_operations(), 0)
+        remove_budget = max(self._remove_rate_tracker.available_operations(), 0)
+        if len(adds) > add_budget or len(removes) > remove_budget:
+            logger.warning("Rate limit reached; deferring remaining list member changes")
+        result["failed"].extend(adds[add_budget:])
+        result["failed_removals"].extend(removes[remove_budget:])
+        adds = adds[:add_budget]
+        removes = removes[:remove_budget]
+
+        semaphore = asyncio.Semaphore(self.MEMBER_OP_CONCURRENCY)
+
+        async def guarded(op: Callable[[str, str], Awaitable[bool]], user_id: str) -> bool:
+            async with semaphore:
+                return await op(list_id, user_id)
+
+        outcomes = await asyncio.gather(
+            *(guarded(self._add_member, target_users[u]) for u in adds),
+            *(guarded(self._remove_member, current_by_username[u]) for u in removes),
+            return_exceptions=True,
+        )
+
+        for username, ok in zip(adds, outcomes[:len(adds)]):
+            result["added" if ok is True else "failed"].append(username)
+        for username, ok in zip(removes, outcomes[len(adds):]):
+            result["removed" if ok is True else "failed_removals"].append(username)
 
         # Update state
         self._state["last_sync"] = datetime.now().isoformat()
         self._state["member_count"] = len(target_usernames) - len(result["failed"])
         self._state["pending_adds"] = result["failed"]
+        self._state["pending_removes"] = result["failed_removals"]
+        # Only a clean sync may be skipped next time; any lookup, add or
+        # removal that failed or was deferred must be retried
+        clean = (
+            not lookup_failed
+            and all(key in target_users for key in keys)
+            and not result["failed"]
+            and not result["failed_removals"]
+        )
+        self._state["last_sync_hash"] = sync_hash if clean else None
+        self._state["synced_usernames"] = sorted(target_usernames) if clean else []
         self._save_state()
 
         logger.info(
             f"List sync complete: {len(result['added'])} added, "
-            f"{len(result['removed'])} removed, {len(result['failed'])} failed"
+            f"{len(result['removed'])} removed, {len(result['failed'])} failed, "
+            f"{len(result['failed_removals'])} removals pending"
         )
 
         return result
@@ -409,65 +587,73 @@ class XListManager:
         Note: The list timeline endpoint doesn't support time filtering,
         so we fetch recent tweets and filter client-side if needed.
 
-        This is the key efficiency gain: 1 API call for ALL sources.
+        This is the key efficiency gain: 1 API call for ALL sources
+        (one more per extra page of 100 when max_results > 100).
         """
         if not self._list_id:
             await self.ensure_list_exists()
 
-        items = []
+        self._ensure_session()
+        items: list[ContentItem] = []
+        append = items.append
+        pagination_token = None
 
         try:
-            # Use OAuth 1.0a (bot client) - owner can access their own list
-            loop = asyncio.get_event_loop()
-            response = await loop.run_in_executor(
-                None,
-                lambda: self._bot_client.get_list_tweets(
-                    id=self._list_id,
-                    max_results=max_results,
+            # Use OAuth 1.0a (bot client) - owner can access their own list.
+            # The endpoint returns at most 100 tweets per page.
+            while len(items) < max_results:
+                response = await self._bot_client.get_list_tweets(
+                    self._list_id,
+                    max_results=min(max_results - len(items), 100),
+                    pagination_token=pagination_token,
                     tweet_fields=["created_at", "public_metrics", "author_id"],
                     expansions=["author_id"],
                     user_fields=["username", "name"],
+                    user_auth=True,
                 )
-            )
 
-            if not response.data:
-                logger.info("No tweets found in list timeline")
-                return items
-
-            # Build author lookup
-            authors = {}
-            if response.includes and "users" in response.includes:
-                for user in response.includes["users"]:
-                    authors[user.id] = {
-                        "username": user.username,
-                        "name": user.name,
-                    }
-
-            # Convert tweets to ContentItems
-            for tweet in response.data:
-                author = authors.get(tweet.author_id, {})
-                metrics = tweet.public_metrics or {}
-                username = author.get("username", "unknown")
-
-                items.append(
-                    ContentItem(
-                        platform="x",
-                        platform_id=str(tweet.id),
-                        source_identifier=username,
-                        source_name=author.get("name"),
-                        content=tweet.text,
-                        url=f"https://x.com/{username}/status/{tweet.id}",
-                        metrics={
-                            "like_count": metrics.get("like_count", 0),
-                            "retweet_count": metrics.get("retweet_count", 0),
-                            "reply_count": metrics.get("reply_count", 0),
-                            "impression_count": metrics.get("impression_count", 0),
-                        },
-                        posted_at=tweet.created_at,
+                if not response.data:
+                    break
+
+                # Build author lookup
+                authors = {}
+                if response.includes and "users" in response.includes:
+                    for user in response.includes["users"]:
+                        authors[user.id] = (user.username, user.name)
+
+                # Convert tweets to ContentItems
+                for tweet in response.data:
+                    username, name = authors.get(tweet.author_id, ("unknown", None))
+                    metrics = tweet.public_metrics or {}
+                    get = metrics.get
+                    tweet_id = str(tweet.id)
+
+                    append(
+                        ContentItem(
+                            platform="x",
+                            platform_id=tweet_id,
+                            source_identifier=username,
+                            source_name=name,
+                            content=tweet.text,
+                            url=f"https://x.com/{username}/status/{tweet_id}",
+                            metrics={
+                                "like_count": get("like_count", 0),
+                                "retweet_count": get("retweet_count", 0),
+                                "reply_count": get("reply_count", 0),
+                                "impression_count": get("impression_count", 0),
+                            },
+                            posted_at=tweet.created_at,
+                        )
                     )
-                )
 
-            logger.info(f"Fetched {len(items)} tweets from list timeline")
+                pagination_token = (response.meta or {}).get("next_token")
+                if not pagination_token:
+                    break
+
+            if items:
+                logger.info(f"Fetched {len(items)} tweets from list timeline")
+            else:
+                logger.info("No tweets found in list timeline")
 
         except tweepy.errors.TooManyRequests:
             logger.warning("Rate limit hit fetching list timeline")
@@ -488,3 +674,24 @@ def get_list_manager() -> XListManager:
     if _list_manager is None:
         _list_manager = XListManager()
     return _list_manager
+
+
+async def get_list_manager_for(list_name: str) -> XListManager:
+    """
+    Get the list manager singleton, pointed at list_name.
+
+    If the singleton manages a different list it is flushed and closed first,
+    so only one manager ever owns the state file and its rate counters.
+    """
+    global _list_manager
+    manager = get_list_manager()
+    if manager.list_name != list_name:
+        await manager.aclose()
+        _list_manager = XListManager(list_name=list_name)
+    return _list_manager
+
+
+async def close_list_manager() -> None:
+    """Flush the list manager singleton's state and close its session. Call on app shutdown."""
+    if _list_manager is not None:
+        await _list_manager.aclose()